@@ -0,0 +1,59 @@
+"""Tiny sqlite-backed cache for LunarCrush responses, keyed by URL.
+
+Stores the raw JSON bytes so repeated runs (and dev iteration loops) skip
+the network round-trip entirely while an entry is fresh, and keeps stale
+entries around as a fallback when the upstream returns a 5xx.
+"""
+import os
+import sqlite3
+import time
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), 'lunar_cache.sqlite')
+
+# Freshness window per endpoint family (seconds)
+DEFAULT_TTL = 60
+TTLS = (
+    ('/coins/list', 30),      # rankings churn fastest
+    ('/news/', 300),          # headlines turn over slowly
+    ('/topics/list', 60),
+    ('/categories/list', 60),
+)
+
+def _ttl_for(url):
+    for fragment, ttl in TTLS:
+        if fragment in url:
+            return ttl
+    return DEFAULT_TTL
+
+def _conn():
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS responses '
+        '(url TEXT PRIMARY KEY, generated_at REAL, body BLOB)'
+    )
+    return conn
+
+def get_fresh(url):
+    """Return cached body bytes if still within the endpoint's TTL."""
+    with _conn() as conn:
+        row = conn.execute(
+            'SELECT generated_at, body FROM responses WHERE url = ?', (url,)
+        ).fetchone()
+    if row and time.time() - row[0] < _ttl_for(url):
+        return row[1]
+    return None
+
+def get_stale(url):
+    """Return the last cached body regardless of age (5xx fallback)."""
+    with _conn() as conn:
+        row = conn.execute(
+            'SELECT body FROM responses WHERE url = ?', (url,)
+        ).fetchone()
+    return row[0] if row else None
+
+def put(url, body):
+    with _conn() as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO responses VALUES (?, ?, ?)',
+            (url, time.time(), body),
+        )
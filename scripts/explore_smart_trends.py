@@ -1,78 +1,86 @@
-import requests
-import json
-import os
+import asyncio
+import heapq
+import sys
 
-API_KEY = '7eakjiw9xbq81tkaxyafx1zenrmjgkotky6ttwuf'
-BASE_URL = 'https://lunarcrush.com/api4/public'
+from lunar_client import BASE_URL, afetch, lunar_session
 
-def get_json(url):
-    print(f"\n> Fetching: {url}")
-    try:
-        res = requests.get(url, headers={'Authorization': f'Bearer {API_KEY}'}, timeout=15)
-        if res.status_code == 200:
-            data = res.json()
-            return data.get('data', [])
-        else:
-            print(f"❌ Error {res.status_code}: {res.text[:200]}")
-            return None
-    except Exception as e:
-        print(f"❌ Exception: {e}")
-        return None
+async def main():
+    print("--- SMART TREND DISCOVERY (News & Narratives) ---\n")
 
-print("--- SMART TREND DISCOVERY (News & Narratives) ---\n")
+    # One session for the whole run so we reuse the keep-alive connection
+    async with lunar_session() as session:
+        # 1. Get Trending TOPICS (Not Coins) + CATEGORIES
+        # This is key to finding "What is happening" vs "What is pumping".
+        # The two lists are independent, so fetch both in one round-trip.
+        print("1️⃣  Identifying Meta Narratives (Topics)...")
+        topics, categories = await asyncio.gather(
+            afetch(session, f"{BASE_URL}/topics/list/v1"),
+            afetch(session, f"{BASE_URL}/categories/list/v1"),
+        )
 
-# 1. Get Trending TOPICS (Not Coins)
-# This is key to finding "What is happening" vs "What is pumping"
-print("1️⃣  Identifying Meta Narratives (Topics)...")
-topics = get_json(f"{BASE_URL}/topics/list/v1")
+        # Rank both lists up front so every deep dive can launch at once.
+        # Only the top 5 matter, so keep a 5-slot heap instead of sorting
+        # the whole list ('or 0' also catches explicit nulls).
+        top_topics = heapq.nlargest(5, topics, key=lambda x: x.get('interactions_24h') or 0) if topics else []
+        top_cats = heapq.nlargest(5, categories, key=lambda x: x.get('interactions_24h') or 0) if categories else []
+        star_topic = top_topics[0].get('topic') if top_topics else None
+        # e.g. "cryptocurrencies" might be boring, let's look for finding a niche
+        # Let's try to find a non-generic one if possible, or just the top one
+        top_cat = top_cats[0].get('category') if top_cats else None
 
-if topics:
-    # Filter out topics that arguably are just coins (if possible) or just show top 10
-    print(f"   Found {len(topics)} topics.")
-    sorted_topics = sorted(topics, key=lambda x: x.get('interactions_24h', 0), reverse=True)
-    
-    top_topics = sorted_topics[:5]
-    for t in top_topics:
-        topic_id = t.get('topic')
-        print(f"   - [{topic_id}] (Vol: {t.get('social_volume_24h')}, Interactions: {t.get('interactions_24h')})")
+        # 2. Deep dives: whatsup + news only depend on the topic list, the
+        # category news only on the category list - the two chains are
+        # independent, so all three round-trips overlap in a single burst
+        dives = {}
+        if star_topic:
+            dives['whatsup'] = afetch(session, f"{BASE_URL}/topic/{star_topic}/whatsup/v1")
+            dives['topic_news'] = afetch(session, f"{BASE_URL}/topic/{star_topic}/news/v1")
+        if top_cat:
+            dives['cat_news'] = afetch(session, f"{BASE_URL}/category/{top_cat}/news/v1")
+        dives = dict(zip(dives, await asyncio.gather(*dives.values()))) if dives else {}
 
-    # 2. Deep Dive into the #1 Topic
-    if top_topics:
-        star_topic = top_topics[0].get('topic')
-        print(f"\n2️⃣  Deep Dive into Top Topic: '{star_topic}'")
-        
-        # A. Try the "WhatsUp" Endpoint (AI Summary provided by LunarCrush?)
-        # /public/topic/:topic/whatsup/v1
-        print(f"   > Asking LunarCrush: 'WhatsUp with {star_topic}?'...")
-        whatsup = get_json(f"{BASE_URL}/topic/{star_topic}/whatsup/v1")
-        if whatsup:
-            print(f"   🧠 AI SUMMARY: {whatsup}") # It might be a string or object
-        
-        # B. Get Actual News
-        print(f"   > Fetching Top News for {star_topic}...")
-        news = get_json(f"{BASE_URL}/topic/{star_topic}/news/v1")
-        if news:
-            for i, n in enumerate(news[:3]):
-                print(f"     {i+1}. {n.get('post_title')} ({n.get('creator_display_name')})")
+        # Everything is fetched - assemble the report in memory and emit it
+        # with one write instead of a print per line
+        out = []
+        append = out.append
 
-# 3. Get Trending CATEGORIES
-print("\n3️⃣  Identifying Market Sectors (Categories)...")
-categories = get_json(f"{BASE_URL}/categories/list/v1")
+        if top_topics:
+            # Filter out topics that arguably are just coins (if possible) or just show top 10
+            append(f"   Found {len(topics)} topics.")
+            for t in top_topics:
+                topic_id = t.get('topic')
+                append(f"   - [{topic_id}] (Vol: {t.get('social_volume_24h')}, Interactions: {t.get('interactions_24h')})")
 
-if categories:
-    # Sort by interactions
-    sorted_cats = sorted(categories, key=lambda x: x.get('interactions_24h', 0), reverse=True)
-    print("   Top 5 Categories:")
-    for c in sorted_cats[:5]:
-        cat_id = c.get('category')
-        print(f"   - {c.get('name')} (Interactions: {c.get('interactions_24h')})")
-        
-    # Deep dive into top category news
-    if sorted_cats:
-        top_cat = sorted_cats[0].get('category') # e.g. "cryptocurrencies" might be boring, let's look for finding a niche
-        # Let's try to find a non-generic one if possible, or just the top one
-        print(f"\n   > News for Top Category: {top_cat}")
-        cat_news = get_json(f"{BASE_URL}/category/{top_cat}/news/v1")
-        if cat_news:
-             for i, n in enumerate(cat_news[:3]):
-                print(f"     {i+1}. {n.get('post_title')}")
+            # Deep Dive into the #1 Topic
+            append(f"\n2️⃣  Deep Dive into Top Topic: '{star_topic}'")
+
+            # A. The "WhatsUp" Endpoint (AI Summary provided by LunarCrush?)
+            whatsup = dives.get('whatsup')
+            if whatsup:
+                append(f"   🧠 AI SUMMARY: {whatsup}") # It might be a string or object
+
+            # B. Actual News
+            news = dives.get('topic_news')
+            if news:
+                for i, n in enumerate(news[:3]):
+                    append(f"     {i+1}. {n.get('post_title')} ({n.get('creator_display_name')})")
+
+        # 3. Trending CATEGORIES (already fetched above)
+        append("\n3️⃣  Identifying Market Sectors (Categories)...")
+        if top_cats:
+            append("   Top 5 Categories:")
+            for c in top_cats:
+                cat_id = c.get('category')
+                append(f"   - {c.get('name')} (Interactions: {c.get('interactions_24h')})")
+
+            # Deep dive into top category news
+            append(f"\n   > News for Top Category: {top_cat}")
+            cat_news = dives.get('cat_news')
+            if cat_news:
+                 for i, n in enumerate(cat_news[:3]):
+                    append(f"     {i+1}. {n.get('post_title')}")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    asyncio.run(main())
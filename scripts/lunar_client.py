@@ -0,0 +1,100 @@
+"""Shared LunarCrush HTTP client for the scripts in this directory.
+
+One aiohttp session per run (keep-alive, pooled connections), one rate
+limiter, one retry/back-off policy and one disk cache - so the individual
+scripts only keep their own ranking/formatting logic. Async callers use
+lunar_session() + afetch(); fetch() is the one-shot synchronous wrapper.
+"""
+import asyncio
+import os
+
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
+
+import _lunar_cache as cache
+
+# Same env var the node side uses (see .env.example)
+API_KEY = os.environ.get('LUNARCRUSH_API_KEY')
+if not API_KEY:
+    raise SystemExit('Set LUNARCRUSH_API_KEY in the environment (see .env.example)')
+BASE_URL = 'https://lunarcrush.com/api4/public'
+
+# Built once; lunar_session() attaches it so requests never rebuild it
+HEADERS = {'Authorization': f'Bearer {API_KEY}'}
+
+# Cap in-flight requests and smooth bursts under the LunarCrush rate limit
+SEM = asyncio.Semaphore(8)
+LIMITER = AsyncLimiter(5, 1)
+
+RETRIES = 4  # attempts for 429s and transient 5xx
+
+def lunar_session(timeout=15):
+    """New aiohttp session with auth + timeout. Use one per script run."""
+    return aiohttp.ClientSession(
+        headers=HEADERS,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    )
+
+# In-process memo: within one run, each URL is fetched at most once (GETs
+# are idempotent here). Mapping to the task rather than the result also
+# collapses concurrent duplicate calls onto a single request in flight.
+_MEMO = {}
+
+async def afetch(session, url):
+    """Memoized GET: see _fetch_json for the actual fetch policy."""
+    task = _MEMO.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(session, url))
+        _MEMO[url] = task
+    return await task
+
+async def _fetch_json(session, url):
+    """GET url and return its 'data' payload (None on failure).
+
+    Serves fresh cache hits without touching the network, retries 429s
+    (honoring Retry-After) and transient 5xx with exponential back-off,
+    and falls back to the last stale cached copy once retries run out.
+    """
+    cached = cache.get_fresh(url)
+    if cached is not None:
+        return orjson.loads(cached).get('data', [])
+    print(f"> Fetching: {url}")
+    try:
+        for attempt in range(RETRIES):
+            async with SEM, LIMITER:
+                async with session.get(url) as res:
+                    if res.status == 200:
+                        raw = await res.read()
+                        cache.put(url, raw)
+                        return orjson.loads(raw).get('data', [])
+                    if res.status == 429:
+                        wait = float(res.headers.get('Retry-After', 1)) * (2 ** attempt)
+                    elif res.status >= 500:
+                        wait = 0.5 * (2 ** attempt)
+                    else:
+                        print(f"❌ Error {res.status}: {(await res.text())[:200]}")
+                        return None
+            print(f"   ⏳ {res.status} from {url}, retrying in {wait:.1f}s...")
+            await asyncio.sleep(wait)
+        # Retries exhausted: last resort is the stale cache
+        stale = cache.get_stale(url)
+        if stale is not None:
+            print(f"⚠️ Upstream still failing, serving stale cache for {url}")
+            return orjson.loads(stale).get('data', [])
+        print(f"❌ Giving up on {url}")
+        return None
+    except Exception as e:
+        print(f"❌ Exception fetching {url}: {e}")
+        return None
+
+def fetch(url, timeout=15):
+    """One-shot synchronous fetch (own session + event loop).
+
+    Handy for quick REPL checks; scripts making several calls should use
+    lunar_session() + afetch() so connections and the memo are shared.
+    """
+    async def _run():
+        async with lunar_session(timeout) as session:
+            return await afetch(session, url)
+    return asyncio.run(_run())
@@ -1,49 +1,89 @@
-import requests
+import asyncio
+import ijson
 import json
-import os
+import sys
 
-# Configuration from previous context
-API_KEY = '7eakjiw9xbq81tkaxyafx1zenrmjgkotky6ttwuf'
+from lunar_client import API_KEY, LIMITER, SEM, lunar_session
+
+# This script probes the api4 root, not just /public
 BASE_URL = 'https://lunarcrush.com/api4'
 
-def test_endpoint(name, url):
-    print(f"\n--- Testing: {name} ---")
-    print(f"URL: {url}")
-    headers = {'Authorization': f'Bearer {API_KEY}'}
+# Fields worth showing to prove data quality
+SAMPLE_KEYS = ('id', 'name', 'symbol', 'post_title', 'interactions_total', 'interactions_24h')
+
+async def _get_with_backoff(session, url):
+    """GET with 429-aware exponential back-off; returns the final response."""
+    for attempt in range(4):
+        async with SEM, LIMITER:
+            response = await session.get(url)
+            if response.status != 429 or attempt == 3:
+                return response
+            wait = float(response.headers.get('Retry-After', 1)) * (2 ** attempt)
+            response.release()
+        print(f"Rate limited, retrying in {wait:.1f}s...")
+        await asyncio.sleep(wait)
+
+async def test_endpoint(session, name, url):
+    """Probe one endpoint and return a structured result.
+
+    No printing in here: the probes run concurrently, so output is
+    aggregated by main() once everything is back.
+    """
+    result = {'name': name, 'url': url, 'ok': False, 'status': None, 'sample': None, 'error': None}
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        status = response.status_code
-        
-        if status == 200:
-            data = response.json()
-            item_count = len(data.get('data', []))
-            print(f"✅ SUCCESS (200 OK)")
-            print(f"Items Found: {item_count}")
-            if item_count > 0:
-                first_item = data['data'][0]
-                # Print a small sample to prove data quality
-                sample = {k: v for k, v in first_item.items() if k in ['id', 'name', 'symbol', 'post_title', 'interactions_total', 'interactions_24h']}
-                print(f"Sample Data: {json.dumps(sample, indent=2)}")
-            return True
-        else:
-            print(f"❌ FAILED ({status})")
-            print(f"Message: {response.text[:200]}")
-            return False
-            
+        async with await _get_with_backoff(session, url) as response:
+            result['status'] = response.status
+            if response.status == 200:
+                # Only the first item matters here: parse the stream and stop
+                # as soon as it shows up instead of downloading the full body
+                first_item = None
+                async for obj in ijson.items(response.content, 'data.item'):
+                    first_item = obj
+                    break
+                if first_item is not None:
+                    result['sample'] = {k: v for k, v in first_item.items() if k in SAMPLE_KEYS}
+                result['ok'] = True
+            else:
+                result['error'] = (await response.text())[:200]
     except Exception as e:
-        print(f"❌ ERROR: {e}")
-        return False
+        result['error'] = str(e)
+    return result
 
-if __name__ == "__main__":
+async def main():
     print(f"Running Diagnostic on LunarCrush Integrations...")
     print(f"API Key: {API_KEY[:5]}...{API_KEY[-5:]}")
-    
-    # 1. Test "Coins List" (Used by Pulse)
-    test_endpoint("Global Market Trends (Pulse)", f"{BASE_URL}/public/coins/list/v1")
-    
-    # 2. Test "Creator Posts" (Used to explain trends)
-    # Testing with 'ETH' as a safe default symbol
-    test_endpoint("Context Posts (ETH)", f"{BASE_URL}/public/creator/twitter/ETH/posts/v1")
-    
-    # 3. Test "Category News" (The new script)
-    test_endpoint("Category News (Cryptocurrencies)", f"{BASE_URL}/public/category/cryptocurrencies/news/v1")
+
+    async with lunar_session(timeout=10) as session:
+        # The three probes are independent -> one concurrent burst:
+        # 1. "Coins List" (Used by Pulse)
+        # 2. "Creator Posts" (Used to explain trends; 'ETH' as a safe default)
+        # 3. "Category News" (The new script)
+        results = await asyncio.gather(
+            test_endpoint(session, "Global Market Trends (Pulse)", f"{BASE_URL}/public/coins/list/v1"),
+            test_endpoint(session, "Context Posts (ETH)", f"{BASE_URL}/public/creator/twitter/ETH/posts/v1"),
+            test_endpoint(session, "Category News (Cryptocurrencies)", f"{BASE_URL}/public/category/cryptocurrencies/news/v1"),
+        )
+
+    # Fixed-order report, untangled from the concurrent fetches; built in
+    # memory and flushed with a single write (one syscall, atomic in CI logs)
+    out = []
+    append = out.append
+    for r in results:
+        append(f"\n--- Testing: {r['name']} ---")
+        append(f"URL: {r['url']}")
+        if r['ok']:
+            append("✅ SUCCESS (200 OK)")
+            if r['sample'] is not None:
+                # Sample proves data quality (default=str: ijson yields Decimals)
+                append(f"Sample Data: {json.dumps(r['sample'], indent=2, default=str)}")
+            else:
+                append("Items Found: 0")
+        elif r['status'] is not None:
+            append(f"❌ FAILED ({r['status']})")
+            append(f"Message: {r['error']}")
+        else:
+            append(f"❌ ERROR: {r['error']}")
+    sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    asyncio.run(main())